@@ -2,10 +2,12 @@ from fastapi import FastAPI
 
 app = FastAPI(title="My First API")
 
+# Return types let FastAPI serialize straight to JSON bytes via Pydantic (Rust),
+# skipping the jsonable_encoder + stdlib json round-trip
 @app.get("/")
-def health():
+def health() -> dict[str, str]:
     return {"status": "ok"}
 
 @app.get("/hello")
-def hello(name: str = "world"):
+def hello(name: str = "world") -> dict[str, str]:
     return {"message": f"Hello {name}!"}
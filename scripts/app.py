@@ -11,7 +11,9 @@ logging.info(f"Using model: {MODEL_NAME}")
 
 
 from fastapi import FastAPI
-import chromadb
+from pydantic import BaseModel
+from scripts.chroma_connection import get_chroma_client
+import asyncio
 import uuid
 
 # Only import ollama when needed (not in mock mode)
@@ -23,7 +25,8 @@ except ImportError:
     OLLAMA_AVAILABLE = False
 
 app = FastAPI()
-chroma = chromadb.PersistentClient(path="./db")
+# Client type (persistent/http/cloud) comes from CHROMA_MODE; defaults to ./db on disk
+chroma = get_chroma_client()
 collection = chroma.get_or_create_collection("docs")
 
 @app.get("/health")
@@ -31,6 +34,12 @@ def health():
     return {"status": "ok"}
 
 
+@app.get("/count")
+def count():
+    """Number of documents in the knowledge base (metadata lookup, no embedding or ANN search)."""
+    return {"count": collection.count()}
+
+
 # @app.post("/query")
 # def query(q: str):
 #     results = collection.query(query_texts=[q], n_results=1)
@@ -68,27 +77,57 @@ def add_knowledge(text: str):
         }
 
 
-@app.post("/query")
-def query(q: str):
-    results = collection.query(query_texts=[q], n_results=1)
-    context = results["documents"][0][0] if results["documents"] else ""
-
+async def generate_answer(q: str, context: str) -> str:
+    """Answer a question from retrieved context (or return the context in mock mode)."""
     # Check if mock mode is enabled
     use_mock = os.getenv("USE_MOCK_LLM", "0") == "1"
     
     if use_mock:
         # Return retrieved context directly (deterministic!)
-        return {"answer": context}
+        return context
     else:
         # Use real LLM (production mode)
         if not OLLAMA_AVAILABLE:
             raise Exception("ollama module is not available. Install it with: pip install ollama")
         
-        answer = ollama.generate(
+        answer = await asyncio.to_thread(
+            ollama.generate,
             model="tinyllama",
             prompt=f"Context:\n{context}\n\nQuestion: {q}\n\nAnswer clearly and concisely:"
         )
-        return {"answer": answer["response"]}
+        return answer["response"]
+
+
+@app.post("/query")
+async def query(q: str):
+    # Chroma and ollama clients are blocking; run them off the event loop
+    results = await asyncio.to_thread(collection.query, query_texts=[q], n_results=1)
+    context = results["documents"][0][0] if results["documents"] else ""
+
+    return {"answer": await generate_answer(q, context)}
+
+
+class QueryBatch(BaseModel):
+    qs: list[str]
+
+
+@app.post("/query_batch")
+async def query_batch(batch: QueryBatch):
+    """Answer several questions with a single batched Chroma query."""
+    if not batch.qs:
+        return {"answers": []}
+
+    # One call embeds all questions together and traverses the index once per batch
+    results = await asyncio.to_thread(collection.query, query_texts=batch.qs, n_results=1)
+    documents = results["documents"] or [[] for _ in batch.qs]
+    contexts = [docs[0] if docs else "" for docs in documents]
+
+    logging.info(f"/query_batch asked {len(batch.qs)} questions")
+
+    answers = await asyncio.gather(
+        *(generate_answer(q, context) for q, context in zip(batch.qs, contexts))
+    )
+    return {"answers": answers}
 
 # if __name__ == "__main__":
 #     import uvicorn
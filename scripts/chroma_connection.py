@@ -4,26 +4,73 @@ from chromadb.api.models.Collection import Collection
 from fastapi import Depends
 from dotenv import load_dotenv
 import os
+import threading
+
+# turbochroma is optional; only needed when CHROMA_QUANTIZE=sq8
+try:
+	from turbochroma import QuantizedCollection, SQ8Codec
+	TURBOCHROMA_AVAILABLE = True
+except ImportError:
+	TURBOCHROMA_AVAILABLE = False
 
 load_dotenv()
 
+EMBEDDING_DIM = 384  # all-MiniLM-L6-v2
+
 _client: ClientAPI | None = None
 _collection: Collection | None = None
+# Guards first-time init so concurrent requests don't each build a client/collection
+_lock = threading.Lock()
+
+# HNSW settings for a <=1M-vector RAG index of normalized MiniLM (384-dim) embeddings.
+# Cosine matches normalized sentence embeddings; lower construction_ef speeds up ingestion,
+# higher search_ef improves recall at query time. Raising M (e.g. 32 for larger corpora)
+# or either ef improves recall at the cost of RAM and latency.
+HNSW_METADATA = {
+	"hnsw:space": "cosine",
+	"hnsw:construction_ef": 100,
+	"hnsw:M": 16,
+	"hnsw:search_ef": 64,
+}
 
 def get_chroma_client() -> ClientAPI:
 	global _client
 	if _client is None:
-		_client = chromadb.CloudClient(
-            api_key=os.getenv("CHROMA_API_KEY"),
-            tenant=os.getenv("CHROMA_TENANT"),
-            database=os.getenv("CHROMA_DATABASE")
-        )
+		with _lock:
+			if _client is None:
+				# "persistent" (default) and "http" keep queries local; "cloud" pays a WAN round-trip
+				mode = os.getenv("CHROMA_MODE", "persistent").lower()
+				if mode == "persistent":
+					_client = chromadb.PersistentClient(path=os.getenv("CHROMA_PATH", "./db"))
+				elif mode == "http":
+					_client = chromadb.HttpClient(
+						host=os.getenv("CHROMA_HOST", "localhost"),
+						port=int(os.getenv("CHROMA_PORT", "8000")),
+					)
+				elif mode == "cloud":
+					_client = chromadb.CloudClient(
+						api_key=os.getenv("CHROMA_API_KEY"),
+						tenant=os.getenv("CHROMA_TENANT"),
+						database=os.getenv("CHROMA_DATABASE")
+					)
+				else:
+					raise ValueError(f"Unknown CHROMA_MODE: {mode!r} (expected persistent, http or cloud)")
 	return _client
 
 def get_chroma_collection(client: ClientAPI = Depends(get_chroma_client)) -> Collection:
 	global _collection
 	if _collection is None:
-		_collection = client.get_or_create_collection(
-		    name="my_collection",
-		)
+		with _lock:
+			if _collection is None:
+				_collection = client.get_or_create_collection(
+				    name="my_collection",
+				    metadata=HNSW_METADATA,
+				)
+				# SQ8 adds an int8 copy of each embedding to row metadata (FP32 vectors are still
+				# stored) and ADC-reranks query_embeddings= queries; query_texts= and add() without
+				# embeddings= bypass it
+				if os.getenv("CHROMA_QUANTIZE", "").lower() == "sq8":
+					if not TURBOCHROMA_AVAILABLE:
+						raise Exception("turbochroma module is not available. Install it with: pip install turbochroma")
+					_collection = QuantizedCollection(_collection, codec=SQ8Codec(dimension=EMBEDDING_DIM))
 	return _collection
\ No newline at end of file
@@ -1,11 +1,115 @@
+import argparse
+import mmap
+import os
+from pathlib import Path
+
 import chromadb
+import onnxruntime
+from dotenv import load_dotenv
+import torch
+from sentence_transformers import SentenceTransformer
+
+EMBED_MODEL = "all-MiniLM-L6-v2"
+EMBED_BATCH_SIZE = 64
+
+# all-MiniLM-L6-v2 truncates input at 256 word-piece tokens (~1000 characters),
+# so chunks are sized to fit that window rather than be silently cut off
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 100
+BATCH_SIZE = 256
+
+
+def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[str]:
+    """Split text into overlapping character chunks (within the embedding model's 256-token window by default)."""
+    if overlap >= chunk_size:
+        raise ValueError("overlap must be smaller than chunk_size")
+    step = chunk_size - overlap
+    chunks = []
+    for start in range(0, len(text), step):
+        chunk = text[start:start + chunk_size].strip()
+        if chunk:
+            chunks.append(chunk)
+        if start + chunk_size >= len(text):
+            break
+    return chunks
+
+
+def load_text(path: str) -> str:
+    """Read a UTF-8 file through a read-only mmap, decoding it in a single pass."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8")
+
+
+def main(input_path: str = "inputs/k8s.txt", collection_name: str = "docs", db_path: str | None = None):
+    """Chunk, embed and store a text file in a persistent Chroma collection."""
+    # Same default store as scripts/chroma_connection.py's persistent mode
+    if db_path is None:
+        db_path = os.getenv("CHROMA_PATH", "./db")
+    # Cores available to this process; process_cpu_count (3.13+) respects CPU affinity
+    embed_threads = getattr(os, "process_cpu_count", os.cpu_count)() or 1
+    # The transformer runs in ONNX Runtime; pooling/normalization run in torch.
+    # Give both every available core for the matmul-bound ingestion pass.
+    torch.set_num_threads(embed_threads)
+
+    client = chromadb.PersistentClient(path=db_path)
+    collection = client.get_or_create_collection(collection_name)
+
+    text = load_text(input_path)
+
+    chunks = chunk_text(text)
+    stem = Path(input_path).stem
+    ids = [f"{stem}-{i}" for i in range(len(chunks))]
+
+    # Drop rows from earlier runs of this file that the new chunking doesn't produce:
+    # the legacy whole-file document (id == stem) and chunks past the new end
+    new_ids = set(ids)
+    stale_ids = [
+        doc_id for doc_id in collection.get(include=[])["ids"]
+        if (doc_id == stem or doc_id.startswith(f"{stem}-")) and doc_id not in new_ids
+    ]
+    if stale_ids:
+        collection.delete(ids=stale_ids)
+
+    # Encode every chunk in one vectorized pass. Same model Chroma uses by default,
+    # so /query's query_texts embeddings stay comparable with these vectors.
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = embed_threads
+    model = SentenceTransformer(
+        EMBED_MODEL,
+        backend="onnx",
+        model_kwargs={"session_options": session_options},
+    )
+    embeddings = model.encode(
+        chunks,
+        batch_size=EMBED_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    ).astype("float32")
 
-client = chromadb.PersistentClient(path="./db")
-collection = client.get_or_create_collection("docs")
+    # Submit in batches to keep each request to Chroma reasonably sized. upsert so
+    # edits to the input file re-index existing ids instead of being skipped.
+    for i in range(0, len(chunks), BATCH_SIZE):
+        collection.upsert(
+            documents=chunks[i:i + BATCH_SIZE],
+            embeddings=embeddings[i:i + BATCH_SIZE].tolist(),
+            ids=ids[i:i + BATCH_SIZE],
+        )
 
-with open("inputs/k8s.txt", "r") as f:
-    text = f.read()
+    print(f"Embedding {input_path} stored in Chroma ({len(chunks)} chunks)")
 
-collection.add(documents=[text], ids=["k8s"])
 
-print("Embedding inputs.txt stored in Chroma")
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Embed a text file into a Chroma collection.")
+    parser.add_argument("input_path", nargs="?", default="inputs/k8s.txt", help="text file to embed")
+    parser.add_argument("--collection", default="docs", help="Chroma collection name")
+    parser.add_argument(
+        "--db-path",
+        default=os.getenv("CHROMA_PATH", "./db"),
+        help="PersistentClient directory (default: $CHROMA_PATH or ./db)",
+    )
+    args = parser.parse_args()
+    main(args.input_path, collection_name=args.collection, db_path=args.db_path)
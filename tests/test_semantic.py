@@ -0,0 +1,50 @@
+import pytest
+
+# Relevant concepts from inputs/k8s.txt; an answer must hit at least one group
+KEYWORD_GROUPS = {
+    "orchestration": ("orchestration",),
+    "software/company": ("software", "company"),
+    "cloud/computing": ("cloud", "computing"),
+    "israel/israeli": ("israel", "israeli"),
+}
+
+@pytest.mark.parametrize("question", ["What is Kubernetes?"])
+def test_kubernetes_query(client, question):
+    response = client.post("/query", params={"q": question})
+    
+    if response.status_code != 200:
+        raise Exception(f"Server returned {response.status_code}: {response.text}")
+    
+    answer = response.json()["answer"]
+    
+    # Validate that we got a meaningful answer
+    assert len(answer) > 0, "Answer is empty"
+    assert "kubernetes" in answer.lower(), f"Answer should mention Kubernetes. Got: {answer[:200]}"
+    
+    # Check for key concepts - be flexible since ChromaDB might return different chunks
+    # The text contains "orchestration" but the semantic search might return a different chunk
+    keywords_found = [
+        label for label, words in KEYWORD_GROUPS.items()
+        if any(word in answer.lower() for word in words)
+    ]
+    
+    # At least one relevant keyword should be present
+    assert len(keywords_found) > 0, f"Answer should contain relevant keywords. Full answer: {answer}"
+    
+    print(f"✅ Kubernetes query test passed. Found keywords: {', '.join(keywords_found)}")
+    print(f"   Answer preview: {answer[:150]}...")
+
+
+def test_kubernetes_query_batch(client):
+    questions = ["What is Kubernetes?", "Who founded Kubernetes?"]
+    response = client.post("/query_batch", json={"qs": questions})
+    
+    if response.status_code != 200:
+        raise Exception(f"Server returned {response.status_code}: {response.text}")
+    
+    answers = response.json()["answers"]
+    
+    # One answer per question, in order
+    assert len(answers) == len(questions), f"Expected {len(questions)} answers. Got: {answers}"
+    for answer in answers:
+        assert "kubernetes" in answer.lower(), f"Answer should mention Kubernetes. Got: {answer[:200]}"